@@ -89,7 +89,7 @@ class User(db.Model):
     is_active = db.Column(db.Boolean, default=True)
     
     # Relationships
-    transactions = db.relationship('Transaction', backref='issued_by', lazy=True)
+    transactions = db.relationship('Transaction', backref='issuer', lazy=True)
 
 
 class Transaction(db.Model):
@@ -128,6 +128,104 @@ class Fine(db.Model):
     notes = db.Column(db.Text)
 
 
+# Precomputed lookup tables (rebuilt by `flask refresh-recommendations`)
+class BookPopularity(db.Model):
+    __tablename__ = 'book_popularity'
+
+    window_days = db.Column(db.Integer, primary_key=True)  # 7, 30, 365
+    rank = db.Column(db.Integer, primary_key=True)
+    book_id = db.Column(db.Integer, db.ForeignKey('books.id', ondelete='CASCADE'), nullable=False)
+    issue_count = db.Column(db.Integer, nullable=False)
+
+    book = db.relationship('Book', lazy='joined')
+
+
+class BookRecommendation(db.Model):
+    __tablename__ = 'book_recommendations'
+
+    book_id = db.Column(db.Integer, db.ForeignKey('books.id', ondelete='CASCADE'), primary_key=True)
+    rank = db.Column(db.Integer, primary_key=True)
+    related_book_id = db.Column(db.Integer, db.ForeignKey('books.id', ondelete='CASCADE'), nullable=False)
+    shared_members = db.Column(db.Integer, nullable=False)
+
+    related_book = db.relationship('Book', foreign_keys=[related_book_id], lazy='joined')
+
+
+class LookupTableRefresh(db.Model):
+    __tablename__ = 'lookup_table_refreshes'
+
+    name = db.Column(db.String(50), primary_key=True)  # recommendations
+    computed_at = db.Column(db.DateTime, nullable=False)
+
+
+POPULARITY_WINDOWS = (7, 30, 365)
+DASHBOARD_POPULARITY_WINDOW = 30
+POPULAR_BOOKS_LIMIT = 5
+RECOMMENDATIONS_LIMIT = 5
+
+
+def refresh_recommendations(now=None):
+    """Rebuild the popularity and co-borrowing tables from loan history."""
+    now = now or datetime.utcnow()
+
+    popularity = []
+    for window_days in POPULARITY_WINDOWS:
+        counts = db.session.query(
+            Transaction.book_id,
+            db.func.count(Transaction.id).label('issue_count')
+        ).filter(
+            Transaction.issue_date >= now - timedelta(days=window_days)
+        ).group_by(Transaction.book_id).order_by(
+            db.desc('issue_count'), Transaction.book_id
+        ).limit(POPULAR_BOOKS_LIMIT).all()
+
+        popularity.extend(
+            BookPopularity(window_days=window_days, rank=rank, book_id=book_id, issue_count=count)
+            for rank, (book_id, count) in enumerate(counts, start=1)
+        )
+
+    # Co-borrowing: one self-join counts, for every (X, Y) pair, the distinct
+    # members who borrowed both, and row_number() keeps the top pairs per
+    # book, so the pair matrix never leaves the database.
+    borrowed = db.session.query(
+        Transaction.member_id, Transaction.book_id
+    ).distinct().subquery()
+    other = db.aliased(borrowed)
+    shared_members = db.func.count().label('shared_members')
+    pairs = db.session.query(
+        borrowed.c.book_id,
+        other.c.book_id.label('related_book_id'),
+        shared_members,
+        db.func.row_number().over(
+            partition_by=borrowed.c.book_id,
+            order_by=(db.desc(shared_members), other.c.book_id)
+        ).label('rank')
+    ).join(
+        other,
+        db.and_(other.c.member_id == borrowed.c.member_id,
+                other.c.book_id != borrowed.c.book_id)
+    ).group_by(borrowed.c.book_id, other.c.book_id).subquery()
+
+    recommendations = [
+        BookRecommendation(book_id=book_id, rank=rank,
+                           related_book_id=related_book_id, shared_members=count)
+        for book_id, related_book_id, count, rank in db.session.query(pairs).filter(
+            pairs.c.rank <= RECOMMENDATIONS_LIMIT
+        )
+    ]
+
+    # Swap the tables' contents in a single transaction so readers never
+    # see a half-built ranking.
+    BookPopularity.query.delete()
+    BookRecommendation.query.delete()
+    db.session.add_all(popularity)
+    db.session.add_all(recommendations)
+    db.session.merge(LookupTableRefresh(name='recommendations', computed_at=now))
+    db.session.commit()
+
+    return len(popularity), len(recommendations)
+
+
 # Authentication Decorator
 def login_required(f):
     @wraps(f)
@@ -210,12 +308,14 @@ def dashboard():
         Transaction.issue_date.desc()
     ).limit(10).all()
 
-    # Popular books
-    popular_books = db.session.query(
-        Book, db.func.count(Transaction.id).label('issue_count')
-    ).join(Transaction).group_by(Book.id).order_by(
-        db.desc('issue_count')
-    ).limit(5).all()
+    # Popular books (precomputed by refresh_recommendations)
+    popular_books = [
+        (entry.book, entry.issue_count)
+        for entry in BookPopularity.query.filter_by(
+            window_days=DASHBOARD_POPULARITY_WINDOW
+        ).order_by(BookPopularity.rank).all()
+    ]
+    popularity_refresh = db.session.get(LookupTableRefresh, 'recommendations')
 
     # Today's statistics
     today = datetime.utcnow().date()
@@ -234,6 +334,8 @@ def dashboard():
                          overdue_books=overdue_books,
                          recent_transactions=recent_transactions,
                          popular_books=popular_books,
+                         popularity_window=DASHBOARD_POPULARITY_WINDOW,
+                         popularity_refresh=popularity_refresh,
                          todays_issues=todays_issues,
                          todays_returns=todays_returns)
 
@@ -263,6 +365,18 @@ def books():
     return render_template('books.html', books=books, categories=categories)
 
 
+@app.route('/books/<book_id>')
+@login_required
+def book_detail(book_id):
+    book = Book.query.filter_by(book_id=book_id).first_or_404()
+
+    recommendations = BookRecommendation.query.filter_by(
+        book_id=book.id
+    ).order_by(BookRecommendation.rank).all()
+
+    return render_template('book_detail.html', book=book, recommendations=recommendations)
+
+
 @app.route('/add_book', methods=['GET', 'POST'])
 @login_required
 def add_book():
@@ -644,11 +758,31 @@ def init_db():
         else:
             print("✅ Database already initialized")
 
+        # Seed the precomputed tables so the dashboard is populated from the start
+        popularity_count, recommendation_count = refresh_recommendations()
+        print(f"✅ Stored {popularity_count} popularity rows and {recommendation_count} recommendations")
 
-if __name__ == '__main__':
+
+@app.cli.command('init-db')
+def init_db_command():
+    """Create tables and the default admin user (run once per deploy)."""
     init_db()
-    
-    # Get port from environment or use default
+
+
+@app.cli.command('refresh-recommendations')
+def refresh_recommendations_command():
+    """Rebuild popular-book and co-borrowing lookup tables.
+
+    Schedule it nightly so the sliding windows stay current, e.g. cron:
+        15 2 * * * cd /path/to/kirinyaga_library && flask --app app refresh-recommendations
+    """
+    popularity_count, recommendation_count = refresh_recommendations()
+    print(f"✅ Stored {popularity_count} popularity rows and {recommendation_count} recommendations")
+
+
+if __name__ == '__main__':
+    # Development server only; production runs `gunicorn -c gunicorn.conf.py wsgi:app`
+    # and sets up the schema with `flask --app app init-db`.
     port = int(os.environ.get('PORT', 5000))
     
     # Run the application
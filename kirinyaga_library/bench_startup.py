@@ -0,0 +1,71 @@
+"""Startup-time benchmark for the production entry point.
+
+    python bench_startup.py [--runs N]
+
+cold start   fresh interpreter: import wsgi (config, models, templates)
+worker spawn fork from a preloaded parent until the child has served
+             its first request, as a gunicorn worker would
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+COLD_START_SCRIPT = """
+import time
+start = time.perf_counter()
+import wsgi
+print(time.perf_counter() - start)
+"""
+
+
+def bench_cold_start(runs):
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', COLD_START_SCRIPT],
+            cwd=HERE, check=True, capture_output=True, text=True
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return timings
+
+
+def bench_worker_spawn(runs):
+    sys.path.insert(0, HERE)
+    from wsgi import app
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        pid = os.fork()
+        if pid == 0:
+            # '/' renders a template without touching the database
+            status = app.test_client().get('/').status_code
+            os._exit(0 if status == 200 else 1)
+        _, exit_status = os.waitpid(pid, 0)
+        if exit_status != 0:
+            raise RuntimeError('worker failed to serve its first request')
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(label, timings):
+    print(f"{label:<14} median {statistics.median(timings) * 1000:8.1f} ms   "
+          f"min {min(timings) * 1000:8.1f} ms   max {max(timings) * 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    report('cold start', bench_cold_start(args.runs))
+    report('worker spawn', bench_worker_spawn(args.runs))
+
+
+if __name__ == '__main__':
+    main()
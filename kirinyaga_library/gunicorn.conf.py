@@ -0,0 +1,42 @@
+# Gunicorn configuration for the library system.
+#
+# Reloading without dropping requests:
+#   kill -HUP <master>   re-reads this file and replaces workers one by one;
+#                        with preload_app the code itself is NOT reloaded.
+#   kill -USR2 <master>  starts a new master + workers on the new code beside
+#                        the old one (same listening socket); once it is up,
+#                        send WINCH then QUIT to the old master to drain it.
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Import the app, config and templates once in the master, then fork
+preload_app = True
+
+# Requests mostly wait on PostgreSQL, so a few threads per process cover the
+# I/O gaps; keep processes near the core count to bound DB connections
+# (pool_size + max_overflow per worker).
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers periodically, staggered so they do not restart together
+max_requests = 1000
+max_requests_jitter = 100
+
+accesslog = '-'
+errorlog = '-'
+
+
+def post_fork(server, worker):
+    # Pooled connections must never be shared across processes. Drop the
+    # inherited pool without closing its sockets, which the master still owns.
+    from app import app, db
+
+    with app.app_context():
+        db.engine.dispose(close=False)
@@ -0,0 +1,32 @@
+"""Production entry point.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Schema setup is a separate one-off step (`flask --app app init-db`), so
+workers never touch the database while booting.
+"""
+from sqlalchemy.orm import configure_mappers
+
+from app import app
+
+
+def warm_up(flask_app):
+    """Load everything a worker needs before it serves its first request.
+
+    The app itself is the module-level instance configured in app.py.
+    Under gunicorn's ``preload_app`` this runs once in the master, so the
+    imported modules, resolved config, configured mappers and compiled
+    templates are shared copy-on-write by every forked worker.
+    """
+    # Production never edits templates in place; skip the per-render mtime check
+    flask_app.config['TEMPLATES_AUTO_RELOAD'] = False
+    flask_app.jinja_env.auto_reload = False
+
+    with flask_app.app_context():
+        configure_mappers()
+
+        for name in flask_app.jinja_env.list_templates():
+            flask_app.jinja_env.get_template(name)
+
+
+warm_up(app)